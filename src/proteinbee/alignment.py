@@ -3,10 +3,9 @@ from dataclasses import (
     field,
 )
 
-from biotite.structure import (
-    rmsd,
-    superimpose,
-)
+import math
+
+import numba
 
 import numpy as np
 
@@ -17,6 +16,95 @@ from proteinbee.structure import Structure
 from typing import Self
 
 
+@numba.njit(cache = True, fastmath = True)
+def _kabsch_rmsd(reference_coords: np.ndarray, mobile_coords: np.ndarray) -> float:
+    """Minimal RMSD after optimal superimposition (Kabsch), computed from the singular values of the covariance matrix.
+
+    Both inputs must be C-contiguous `float64` arrays of shape (N, 3). Returns NaN when N is zero.
+    """
+    n = reference_coords.shape[0]
+    if n == 0:
+        # Nothing to superimpose; matches the NaN biotite's rmsd gives for empty selections.
+        return np.nan
+    # Centring is folded into a single pass via H = PᵀQ - (ΣP)(ΣQ)ᵀ / N and ‖Pc‖² = ‖P‖² - ‖ΣP‖² / N.
+    # Coordinates are taken relative to their first atom, which leaves the RMSD unchanged but limits cancellation.
+    ox, oy, oz = reference_coords[0, 0], reference_coords[0, 1], reference_coords[0, 2]
+    mox, moy, moz = mobile_coords[0, 0], mobile_coords[0, 1], mobile_coords[0, 2]
+    rx = ry = rz = 0.0
+    mx = my = mz = 0.0
+    h00 = h01 = h02 = 0.0
+    h10 = h11 = h12 = 0.0
+    h20 = h21 = h22 = 0.0
+    reference_ss = 0.0
+    mobile_ss = 0.0
+    for i in range(n):
+        px = reference_coords[i, 0] - ox
+        py = reference_coords[i, 1] - oy
+        pz = reference_coords[i, 2] - oz
+        qx = mobile_coords[i, 0] - mox
+        qy = mobile_coords[i, 1] - moy
+        qz = mobile_coords[i, 2] - moz
+        rx += px
+        ry += py
+        rz += pz
+        mx += qx
+        my += qy
+        mz += qz
+        h00 += px * qx
+        h01 += px * qy
+        h02 += px * qz
+        h10 += py * qx
+        h11 += py * qy
+        h12 += py * qz
+        h20 += pz * qx
+        h21 += pz * qy
+        h22 += pz * qz
+        reference_ss += px * px + py * py + pz * pz
+        mobile_ss += qx * qx + qy * qy + qz * qz
+    h00 -= rx * mx / n
+    h01 -= rx * my / n
+    h02 -= rx * mz / n
+    h10 -= ry * mx / n
+    h11 -= ry * my / n
+    h12 -= ry * mz / n
+    h20 -= rz * mx / n
+    h21 -= rz * my / n
+    h22 -= rz * mz / n
+    reference_ss -= (rx * rx + ry * ry + rz * rz) / n
+    mobile_ss -= (mx * mx + my * my + mz * mz) / n
+    if reference_ss + mobile_ss < 1e-12 * n:
+        # Both sets collapse onto their centroids, so the RMSD is bounded by sqrt(2e-12); skip the decomposition.
+        return 0.0
+    covariance = np.array(
+        [
+            [h00, h01, h02],
+            [h10, h11, h12],
+            [h20, h21, h22],
+        ]
+    )
+    # The singular values of H are the square roots of the eigenvalues of the symmetric HᵀH.
+    eigenvalues, _ = np.linalg.eigh(covariance.T @ covariance)
+    s = np.sqrt(np.maximum(eigenvalues[:: -1], 0.0))
+    if s[-1] < 1e-4 * s[0]:
+        # Squaring H limits the absolute accuracy of the small eigenvalues to about machine epsilon times the largest,
+        # so near-degenerate (e.g. almost collinear) coordinates fall back to a full SVD.
+        _, s, _ = np.linalg.svd(covariance)
+    # Correct for a reflection so that the optimal transform is a proper rotation.
+    # sign(det(V Uᵀ)) equals sign(det(H)) since the singular values are non-negative.
+    s[-1] *= np.sign(np.linalg.det(covariance))
+    msd = (reference_ss + mobile_ss - 2.0 * s.sum()) / n
+    return math.sqrt(max(msd, 0.0))
+
+
+@numba.njit(cache = True)
+def _kabsch_rmsd_batch(reference_coords: np.ndarray, mobile_coords_batch: np.ndarray) -> np.ndarray:
+    """`_kabsch_rmsd` of each (N, 3) structure in a C-contiguous `float64` (B, N, 3) batch against one reference."""
+    deviations = np.empty(mobile_coords_batch.shape[0])
+    for b in range(mobile_coords_batch.shape[0]):
+        deviations[b] = _kabsch_rmsd(reference_coords, mobile_coords_batch[b])
+    return deviations
+
+
 @dataclass(slots = True, frozen = True)
 class StructureAlignment:
     structure: Structure
@@ -24,32 +112,49 @@ class StructureAlignment:
     _motif_structure: Structure = field(
         init = False,
     )
+    _motif_coords: np.ndarray = field(
+        init = False,
+        repr = False,
+        compare = False,
+    )
+    _motif_n_atoms: int = field(
+        init = False,
+        repr = False,
+        compare = False,
+    )
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "_motif_structure", self.structure.select_using_motif(self.motif))
+        object.__setattr__(
+            self,
+            "_motif_coords",
+            np.ascontiguousarray(self._motif_structure.atom_array.coord, dtype = np.float64),
+        )
+        object.__setattr__(self, "_motif_n_atoms", len(self._motif_coords))
 
     def get_motif_structure(self) -> Structure:
         return self._motif_structure
 
     def get_motif_deviation(self, reference: Self) -> float:
-        reference_motif_structure = reference.get_motif_structure()
-        assert len(self._motif_structure.atom_array) == len(reference_motif_structure.atom_array)
-        reference_coords = reference_motif_structure.atom_array.coord
-        mobile_coords = self._motif_structure.atom_array.coord
-        deviation = self.root_mean_square_deviation(
-            reference_coords,
-            mobile_coords,
+        assert self._motif_n_atoms == reference._motif_n_atoms
+        return _kabsch_rmsd(
+            reference._motif_coords,
+            self._motif_coords,
         )
-        return deviation
 
     @staticmethod
-    def root_mean_square_deviation(reference_coords: np.array, mobile_coords: np.array) -> float:
+    def root_mean_square_deviation(reference_coords: np.ndarray, mobile_coords: np.ndarray) -> float:
         assert reference_coords.shape[0] == mobile_coords.shape[0]
-        aligned_coords, _ = superimpose(
-            reference_coords,
-            mobile_coords,
+        return _kabsch_rmsd(
+            np.ascontiguousarray(reference_coords, dtype = np.float64),
+            np.ascontiguousarray(mobile_coords, dtype = np.float64),
+        )
+
+    @classmethod
+    def root_mean_square_deviation_batch(cls, reference_coords: np.ndarray, mobile_coords_batch: np.ndarray) -> np.ndarray:
+        """Minimal RMSD of each structure in a (B, N, 3) batch against a single (N, 3) reference."""
+        assert reference_coords.shape[0] == mobile_coords_batch.shape[1]
+        return _kabsch_rmsd_batch(
+            np.ascontiguousarray(reference_coords, dtype = np.float64),
+            np.ascontiguousarray(mobile_coords_batch, dtype = np.float64),
         )
-        return rmsd(
-            reference_coords,
-            aligned_coords,
-        )
\ No newline at end of file
@@ -1,54 +1,82 @@
 import collections
 
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import numpy as np
 
-import re
+import sys
 
 from typing import (
-    ClassVar,
+    Iterable,
     Iterator,
-    Pattern,
+    NamedTuple,
     Self,
 )
 
 
-@dataclass(slots = True, frozen = True)
-class Selector:
+class _SelectorFields(NamedTuple):
     chain: str
     """The chain ID."""
     start: int
     """The start number in the chain."""
     end: int
     """The end number in the chain."""
-    _selector_pattern_re: ClassVar[Pattern[str]] = re.compile(
-        r"^[A-Z][0-9]{1,5}-?[0-9]{1,5}?$",
-    )
-    """Private variable to validate input."""
+
+
+class Selector(_SelectorFields):
+    """A residue range on a chain, e.g. `A786-790`.
+
+    Being tuple-backed, a selector compares equal to (and hashes like) the plain tuple `(chain, start, end)` and is
+    ordered like one. `len()` is the number of residues covered, not the number of fields.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _make(cls, iterable: Iterable[str | int]) -> Self:
+        """Same as `NamedTuple._make` (and so `_replace`), but counts fields without the overridden `__len__`."""
+        result = tuple.__new__(cls, iterable)
+        if tuple.__len__(result) != len(cls._fields):
+            raise TypeError(f"Expected {len(cls._fields)} arguments, got {tuple.__len__(result)}")
+        return result
 
     @classmethod
     def from_string(cls, s: str) -> Self:
         """Construct a selector from a string."""
-        cls._pattern_check(s)
-        range_ = s[1: ].split("-")
+        dash = s.find("-")
+        if dash < 0:
+            start, end = s[1 :], s[1 :]
+        else:
+            start, end = s[1 : dash], s[dash + 1 :]
+        if not (
+            s.isascii()
+            and "A" <= s[: 1] <= "Z"
+            and 0 < len(start) <= 5
+            and start.isdigit()
+            and 0 < len(end) <= 5
+            and end.isdigit()
+        ):
+            raise ValueError(f"Invalid selector string: {s}. The selector string should be of the form: A786-790.")
+        range_ = (int(start), int(end))
         cls._range_check(range_)
-        return cls(s[0], int(range_[0]), int(range_[1]))
+        return cls(sys.intern(s[0]), *range_)
     
     @classmethod
     def check_string(cls, s: str) -> bool:
         """Validate selector."""
-        return cls._pattern_check(s) and cls._range_check(s[1 :].split())
-
-    @classmethod
-    def _pattern_check(cls, s: str) -> None:
-        """Validate selector string pattern."""
-        if not re.fullmatch(cls._selector_pattern_re, s):
-            raise ValueError(f"Invalid selector string: {s}. The selector string should be of the form: A786-790.")
+        try:
+            cls.from_string(s)
+        except ValueError:
+            return False
+        return True
 
     @staticmethod
-    def _range_check(range_: tuple[str, str]) -> None:
+    def _range_check(range_: tuple[int, int]) -> None:
         """Validate selector range."""
         r1, r2 = range_
-        if not int(r1) <= int(r2):
+        if not r1 <= r2:
             raise ValueError(
                 f"Invalid range: {range_} in selector."
                 f"The number left of '-' should be smaller than the number right of '-'."
@@ -61,55 +89,101 @@ class Selector:
         return f"{self.chain}{self.start}-{self.end}"
 
 
-@dataclass
+@dataclass(slots = True, frozen = True)
 class Motif:
-    components: list[Selector | int]
+    components: tuple[Selector | int, ...]
     """Components of the motif which can be `Selectors` or integers."""
     delim: str 
     """The internal delimiter to use for the selector."""
+    _selectors: list[Selector] = field(
+        init = False,
+        repr = False,
+        compare = False,
+    )
+    """Private variable holding the selectors in order."""
+    _segments: list[int] = field(
+        init = False,
+        repr = False,
+        compare = False,
+    )
+    """Private variable holding the segments (including `-1`) in order."""
+    _order: bytearray = field(
+        init = False,
+        repr = False,
+        compare = False,
+    )
+    """Private variable tagging each component as a segment (`0`) or a selector (`1`)."""
+    _str: str | None = field(
+        default = None,
+        init = False,
+        repr = False,
+        compare = False,
+    )
+    """Private variable caching the string form, filled in on the first `str()` call."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "components", tuple(self.components))
+        object.__setattr__(self, "_selectors", [])
+        object.__setattr__(self, "_segments", [])
+        object.__setattr__(self, "_order", bytearray())
+        for comp in self.components:
+            if isinstance(comp, Selector):
+                self._selectors.append(comp)
+                self._order.append(1)
+            else:
+                self._segments.append(comp)
+                self._order.append(0)
 
     @classmethod
     def from_string(cls, s: str, delim: str = "/") -> Self:
         """Construct a `Motif` from a string."""
         components = []
-        for sel in s.split(delim):
-            if sel.isnumeric() or sel == "-1":
-                components.append(int(sel))
+        step = len(delim)
+        start = 0
+        while True:
+            end = s.find(delim, start)
+            token = s[start :] if end < 0 else s[start : end]
+            if token[: 1].isdigit() or token == "-1":
+                components.append(int(token))
             else:
                 components.append(
-                    Selector.from_string(sel),
+                    Selector.from_string(token),
                 )
-        return cls(components, delim)
+            if end < 0:
+                return cls(components, delim)
+            start = end + step
     
-    def selector_iter(self) -> Iterator[str]:
+    def selector_iter(self) -> Iterator[Selector]:
         """Iterate over selectors in the motif."""
-        yield from (
-            x
-            for x in self.components
-            if isinstance(x, Selector)
-        )
+        yield from self._selectors
 
-    def segment_iter(self) -> Iterator[str]:
+    def segment_iter(self) -> Iterator[int]:
         """Iterate over the segments in the motif."""
         yield from (
             x
-            for x in self.components
-            if isinstance(x, int) and x != -1
+            for x in self._segments
+            if x != -1
         )
 
     def get_motif_wrt_designed_structure(self, chain_id: str = "A") -> Self:
         """Convert any motif to one that is being designed. Essentially renumber and rechain."""
-        m_str = ""
+        chain_id = sys.intern(chain_id)
+        new_components: list[Selector | int] = []
         curr_pos = 1
-        for comp in self.components:
-            if isinstance(comp, int):
-                    m_str += f"{comp}/"
-                    curr_pos += comp
-            if isinstance(comp, Selector):
-                design_chain = chain_id
-                m_str += f"{design_chain}{curr_pos}-{curr_pos + len(comp) - 1}/"
-                curr_pos += len(comp)
-        return type(self).from_string(m_str[: -1])
+        selectors = iter(self._selectors)
+        segments = iter(self._segments)
+        for is_selector in self._order:
+            if is_selector:
+                comp_len = len(next(selectors))
+                new_components.append(
+                    Selector(chain_id, curr_pos, curr_pos + comp_len - 1),
+                )
+                curr_pos += comp_len
+            else:
+                comp = next(segments)
+                new_components.append(comp)
+                curr_pos += comp
+        return type(self)(new_components, self.delim)
 
     def get_motif_wrt_designed_structure_multi_chain(self) -> Iterator[Self]:
         """Convert any motif to one that is being designed. Essentially renumber and rechain. (This is multi-chained)"""
@@ -119,22 +193,40 @@ class Motif:
 
     def get_selector_counts(self) -> dict[Selector, int]:
         """Get the counts of each selector in the motif."""
-        counter = collections.defaultdict(int)
-        for selector in self.selector_iter():
-            counter[selector] += 1
-        return dict(counter)
+        return dict(collections.Counter(self._selectors))
     
-    def split_by_chain(self) -> Iterator[list[int | Selector]]:
+    def split_by_chain(self) -> Iterator[Self]:
         """Split the motif by different chains. This is an iterator."""
         motif_components_batch = []
-        for i, comp in enumerate(self.components):
-            if comp == 0 or i == len(self.components) - 1:
-                if comp != 0:
-                    motif_components_batch.append(comp)
+        for comp in self.components:
+            if isinstance(comp, int) and comp == 0:
                 yield type(self)(motif_components_batch, self.delim)
                 motif_components_batch = []
             else:
                 motif_components_batch.append(comp)
+        if motif_components_batch:
+            yield type(self)(motif_components_batch, self.delim)
         
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compact array form of the motif: `(chains, starts, ends, segments, order)`.
+
+        `chains` holds the code of each selector's single-character chain (`uint8`), `starts` and `ends` its bounds
+        (`uint16`), `segments` every segment including `-1` and `0` (`int16`) and `order` tags each component as a
+        segment (`0`) or a selector (`1`) (`uint8`).
+
+        Only bounds in `0..65535` and segments in `-32768..32767` are representable; anything else (e.g. `A1-99999`,
+        which `Selector.from_string` accepts) raises `OverflowError`. A multi-character chain raises `TypeError`.
+        """
+        n_sel = len(self._selectors)
+        # `ord` raises for multi-character chains, so the arrays can never silently fall out of step.
+        chains = np.fromiter((ord(sel.chain) for sel in self._selectors), dtype = np.uint8, count = n_sel)
+        starts = np.fromiter((sel.start for sel in self._selectors), dtype = np.uint16, count = n_sel)
+        ends = np.fromiter((sel.end for sel in self._selectors), dtype = np.uint16, count = n_sel)
+        segments = np.array(self._segments, dtype = np.int16)
+        order = np.frombuffer(self._order, dtype = np.uint8).copy()
+        return chains, starts, ends, segments, order
+
     def __str__(self) -> str:
-        return self.delim.join(str(x) for x in self.components)
\ No newline at end of file
+        if self._str is None:
+            object.__setattr__(self, "_str", self.delim.join(str(x) for x in self.components))
+        return self._str
\ No newline at end of file
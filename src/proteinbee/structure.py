@@ -184,7 +184,7 @@ class Structure:
             raise ValueError("The structures do not have the same atoms.")
         raise NotImplementedError("Structure alignment not yet implemented.")
 
-    def _create_atom_array_mask(self, attr: str, items: Iterable[str]) -> np.array:
+    def _create_atom_array_mask(self, attr: str, items: Iterable[str]) -> np.ndarray:
         mask = np.array([False] * len(self.atom_array), dtype = bool)
         for item in items:
             mask |= (getattr(self.atom_array, attr) == item)
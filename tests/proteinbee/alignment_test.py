@@ -1,3 +1,8 @@
+from biotite.structure import (
+    rmsd as biotite_rmsd,
+    superimpose,
+)
+
 import numpy as np
 
 from proteinbee import alignment
@@ -9,6 +14,39 @@ from proteinbee.structure import Structure
 import pytest
 
 
+def _random_rotation(rng: np.random.Generator) -> np.ndarray:
+    q, r = np.linalg.qr(rng.normal(size = (3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] *= -1
+    return q
+
+
+def _perturbed(rng: np.random.Generator, coords: np.ndarray, noise: float) -> np.ndarray:
+    """Randomly rotate, translate and add Gaussian noise to `coords`."""
+    return (
+        coords @ _random_rotation(rng).T
+        + rng.normal(scale = 20.0, size = 3)
+        + rng.normal(scale = noise, size = coords.shape)
+    ).astype(np.float32)
+
+
+def _biotite_rmsd(ref_coords: np.ndarray, mobile_coords: np.ndarray) -> float:
+    """Reference RMSD from biotite, run in double precision so its float32 rounding does not set the tolerance."""
+    ref_coords_64 = ref_coords.astype(np.float64)
+    aligned_coords, _ = superimpose(ref_coords_64, mobile_coords.astype(np.float64))
+    return float(biotite_rmsd(ref_coords_64, aligned_coords))
+
+
+_rng = np.random.default_rng(7)
+_random_coords = (_rng.normal(size = (60, 3)) * 10.0).astype(np.float32)
+_planar_coords = (_rng.normal(size = (40, 3)) * [10.0, 10.0, 0.0]).astype(np.float32)
+_collinear_coords = (
+    np.linspace(0.0, 30.0, 25)[:, None] * [1.0, 2.0, 3.0]
+    + _rng.normal(scale = 1e-3, size = (25, 3))
+).astype(np.float32)
+
+
 @pytest.mark.parametrize(
     "struc, motif",
     [
@@ -49,8 +87,8 @@ def test_structure_alignment_creation(struc: Structure, motif: Motif) -> None:
     ],
 )
 def test_structure_alignment_root_mean_square_deviation(
-    ref_coords: np.array,
-    mobile_coords: np.array,
+    ref_coords: np.ndarray,
+    mobile_coords: np.ndarray,
     expected: float
 ) -> None:
     rmsd = alignment.StructureAlignment.root_mean_square_deviation(ref_coords, mobile_coords)
@@ -58,6 +96,148 @@ def test_structure_alignment_root_mean_square_deviation(
 
 
 
+@pytest.mark.parametrize(
+    "coords",
+    [
+        _collinear_coords,
+        (np.arange(30, dtype = np.float32).reshape(10, 3) ** 1.5),
+        (np.linspace(0.0, 50.0, 100)[:, None] * [0.3, -1.0, 2.0] + [400.0, 0.0, -80.0]).astype(np.float32),
+    ],
+)
+def test_structure_alignment_root_mean_square_deviation_near_collinear_identical(coords: np.ndarray) -> None:
+    rmsd = alignment.StructureAlignment.root_mean_square_deviation(coords, coords.copy())
+    assert rmsd == pytest.approx(0.0, abs = 1e-5)
+
+
+@pytest.mark.parametrize(
+    "ref_coords, mobile_coords, tolerance",
+    [
+        (
+            _random_coords,
+            _perturbed(_rng, _random_coords, noise = 0.5),
+            1e-4,
+        ),
+        (
+            _random_coords,
+            _perturbed(_rng, _random_coords, noise = 3.0),
+            1e-4,
+        ),
+        (
+            _random_coords,
+            (_random_coords * [-1.0, 1.0, 1.0]).astype(np.float32),
+            1e-4,
+        ),
+        (
+            _random_coords,
+            _perturbed(_rng, _random_coords * [1.0, -1.0, 1.0], noise = 0.5),
+            1e-4,
+        ),
+        (
+            _planar_coords,
+            _perturbed(_rng, _planar_coords, noise = 0.5),
+            1e-4,
+        ),
+        (
+            _planar_coords,
+            (_planar_coords * [-1.0, 1.0, 1.0]).astype(np.float32),
+            1e-4,
+        ),
+        (
+            _collinear_coords,
+            _perturbed(_rng, _collinear_coords, noise = 0.1),
+            1e-3,
+        ),
+        (
+            _collinear_coords,
+            _collinear_coords,
+            1e-4,
+        ),
+    ],
+)
+def test_structure_alignment_root_mean_square_deviation_against_biotite(
+    ref_coords: np.ndarray,
+    mobile_coords: np.ndarray,
+    tolerance: float,
+) -> None:
+    expected = _biotite_rmsd(ref_coords, mobile_coords)
+    rmsd = alignment.StructureAlignment.root_mean_square_deviation(ref_coords, mobile_coords)
+    # Kabsch gives the minimal RMSD, so it can only undercut biotite, which is less exact for near-collinear inputs.
+    assert rmsd <= expected + 1e-6
+    assert rmsd == pytest.approx(expected, abs = tolerance)
+
+
+@pytest.mark.parametrize(
+    "ref_coords, mobile_coords_batch, expected",
+    [
+        (
+            np.zeros((100, 3), dtype = np.float32),
+            np.zeros((4, 100, 3), dtype = np.float32),
+            np.zeros(4),
+        ),
+        (
+            np.arange(30, dtype = np.float32).reshape(10, 3) ** 1.5,
+            np.stack(
+                [
+                    np.arange(30, dtype = np.float32).reshape(10, 3) ** 1.5,
+                    np.arange(30, dtype = np.float32).reshape(10, 3) ** 1.5 + 5.0,
+                    -(np.arange(30, dtype = np.float32).reshape(10, 3) ** 1.5) * [1.0, -1.0, 1.0],
+                ]
+            ),
+            np.zeros(3),
+        ),
+        (
+            _random_coords,
+            np.stack(
+                [
+                    _perturbed(_rng, _random_coords, noise = 0.5),
+                    _perturbed(_rng, _random_coords, noise = 3.0),
+                    (_random_coords * [-1.0, 1.0, 1.0]).astype(np.float32),
+                    _perturbed(_rng, _random_coords * [1.0, 1.0, -1.0], noise = 0.5),
+                ]
+            ),
+            None,
+        ),
+        (
+            _planar_coords,
+            np.stack(
+                [
+                    _perturbed(_rng, _planar_coords, noise = 0.5),
+                    (_planar_coords * [-1.0, 1.0, 1.0]).astype(np.float32),
+                ]
+            ),
+            None,
+        ),
+    ],
+)
+def test_structure_alignment_root_mean_square_deviation_batch(
+    ref_coords: np.ndarray,
+    mobile_coords_batch: np.ndarray,
+    expected: np.ndarray | None,
+) -> None:
+    if expected is None:
+        expected = np.array([_biotite_rmsd(ref_coords, mobile_coords) for mobile_coords in mobile_coords_batch])
+    rmsd = alignment.StructureAlignment.root_mean_square_deviation_batch(ref_coords, mobile_coords_batch)
+    assert rmsd.shape == expected.shape
+    assert rmsd == pytest.approx(expected, abs = 1e-4)
+    for mobile_coords, rmsd_single in zip(mobile_coords_batch, rmsd):
+        assert pytest.approx(rmsd_single, abs = 1e-3) == alignment.StructureAlignment.root_mean_square_deviation(
+            ref_coords,
+            mobile_coords,
+        )
+
+
+def test_structure_alignment_root_mean_square_deviation_empty() -> None:
+    empty = np.zeros((0, 3), dtype = np.float32)
+    assert np.isnan(alignment.StructureAlignment.root_mean_square_deviation(empty, empty))
+    rmsd = alignment.StructureAlignment.root_mean_square_deviation_batch(empty, np.zeros((2, 0, 3), dtype = np.float32))
+    assert rmsd.shape == (2, )
+    assert np.isnan(rmsd).all()
+    assert alignment.StructureAlignment.root_mean_square_deviation_batch(
+        _random_coords,
+        np.zeros((0, *_random_coords.shape), dtype = np.float32),
+    ).shape == (0, )
+
+
 @pytest.mark.parametrize(
     "ref_struc, mobile_struc, ref_motif, mobile_motif, expected",
     [
@@ -1,5 +1,7 @@
 import hypothesis as hp
 
+import numpy as np
+
 from proteinbee import motif
 
 import pytest
@@ -60,6 +62,60 @@ def test_selector_init_special(sel: str, length: int) -> None:
     assert len(selector) == length
 
 
+@pytest.mark.parametrize(
+    "sel",
+    [
+        "",
+        "a12-24",
+        "A-24",
+        "A12-",
+        "A123456-123457",
+        "A24-12",
+        "A12-24-36",
+        "AB12-24",
+    ],
+)
+def test_selector_init_invalid(sel: str) -> None:
+    with pytest.raises(ValueError):
+        motif.Selector.from_string(sel)
+
+
+@pytest.mark.parametrize(
+    "sel, expected",
+    [
+        ("A12-24", True),
+        ("X10-10", True),
+        ("A12", True),
+        ("A24-12", False),
+        ("a12-24", False),
+        ("A12-24-36", False),
+    ],
+)
+def test_selector_check_string(sel: str, expected: bool) -> None:
+    assert motif.Selector.check_string(sel) is expected
+
+
+@pytest.mark.parametrize(
+    "sel, replacements, expected",
+    [
+        ("A12-24", {"chain": "B"}, "B12-24"),
+        ("A12-14", {"start": 10}, "A10-14"),
+        ("X10-10", {"start": 1, "end": 100}, "X1-100"),
+    ],
+)
+def test_selector_replace(sel: str, replacements: dict[str, str | int], expected: str) -> None:
+    selector = motif.Selector.from_string(sel)._replace(**replacements)
+    assert isinstance(selector, motif.Selector)
+    assert selector == motif.Selector.from_string(expected)
+    assert motif.Selector._make(tuple(selector)) == selector
+    with pytest.raises(TypeError):
+        motif.Selector._make(("A", 1))
+
+
+def test_selector_init_single_residue() -> None:
+    assert motif.Selector.from_string("A12") == motif.Selector("A", 12, 12)
+
+
 @hp.given(st_motif())
 def test_motif_init(motif_elements: tuple[list[str | motif.Selector], str]) -> None:
     m, delim = motif_elements
@@ -179,6 +235,34 @@ def test_get_motif_wrt_designed_structure_multi_chain(motif: motif.Motif, expect
     assert list(motif.get_motif_wrt_designed_structure_multi_chain()) == expected
 
 
+@pytest.mark.parametrize(
+    "motif, expected",
+    [
+        (
+            motif.Motif.from_string("10/A322-326/5/0/B531-539/5/B551-562"),
+            [
+                motif.Motif.from_string("10/A322-326/5"),
+                motif.Motif.from_string("B531-539/5/B551-562"),
+            ],
+        ),
+        (
+            motif.Motif.from_string("A322-326/0"),
+            [
+                motif.Motif.from_string("A322-326"),
+            ],
+        ),
+        (
+            motif.Motif.from_string("A322-326"),
+            [
+                motif.Motif.from_string("A322-326"),
+            ],
+        ),
+    ],
+)
+def test_split_by_chain(motif: motif.Motif, expected: list[motif.Motif]) -> None:
+    assert list(motif.split_by_chain()) == expected
+
+
 @pytest.mark.parametrize(
     "motif, expected",
     [
@@ -208,3 +292,60 @@ def test_get_motif_wrt_designed_structure_multi_chain(motif: motif.Motif, expect
 )
 def test_get_selector_counts(motif: motif.Motif, expected: dict[str, int]) -> None:
     assert motif.get_selector_counts() == expected
+
+
+@pytest.mark.parametrize(
+    "motif, expected",
+    [
+        (
+            motif.Motif.from_string("25/A814-824/25"),
+            (
+                [ord("A")],
+                [814],
+                [824],
+                [25, 25],
+                [0, 1, 0],
+            ),
+        ),
+        (
+            motif.Motif.from_string("10/A322-326/-1/B531-539/0/C1-65535"),
+            (
+                [ord("A"), ord("B"), ord("C")],
+                [322, 531, 1],
+                [326, 539, 65535],
+                [10, -1, 0],
+                [0, 1, 0, 1, 0, 1],
+            ),
+        ),
+    ],
+)
+def test_motif_to_arrays(motif: motif.Motif, expected: tuple[list[int], ...]) -> None:
+    arrays = motif.to_arrays()
+    assert [arr.dtype for arr in arrays] == [np.uint8, np.uint16, np.uint16, np.int16, np.uint8]
+    for arr, arr_expected in zip(arrays, expected):
+        np.testing.assert_array_equal(arr, arr_expected)
+
+
+@pytest.mark.parametrize(
+    "motif",
+    [
+        motif.Motif((motif.Selector("AB", 1, 2), 5), "/"),
+        motif.Motif.from_string("5/A1-10/5").get_motif_wrt_designed_structure("AB"),
+    ],
+)
+def test_motif_to_arrays_multi_character_chain(motif: motif.Motif) -> None:
+    with pytest.raises(TypeError):
+        motif.to_arrays()
+
+
+@pytest.mark.parametrize(
+    "motif",
+    [
+        motif.Motif.from_string("5/A1-99999/5"),
+        motif.Motif.from_string("5/A70000-70010/5"),
+        motif.Motif.from_string("40000/A1-10/5"),
+    ],
+)
+def test_motif_to_arrays_out_of_range(motif: motif.Motif) -> None:
+    with pytest.raises(OverflowError):
+        motif.to_arrays()